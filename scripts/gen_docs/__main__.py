@@ -15,6 +15,7 @@ from viseron.helpers.validators import (
     CoerceNoneToDict,
     Deprecated,
     Maybe,
+    NonEmptyString,
     Slug,
 )
 from viseron.types import SupportedDomains
@@ -222,6 +223,11 @@ def convert(schema, custom_convert=None):  # noqa: C901
         return {
             "type": "string",
         }
+    if isinstance(schema, NonEmptyString):
+        return {
+            "type": "string",
+            "lengthMin": 1,
+        }
 
     if isinstance(schema, Deprecated):
         return {
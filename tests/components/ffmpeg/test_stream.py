@@ -1,6 +1,7 @@
 """FFmpeg stream tests."""
 from __future__ import annotations
 
+from collections.abc import Generator
 from contextlib import nullcontext
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -8,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from viseron.components.ffmpeg.const import (
+    CAMERA_INPUT_ARGS,
     CONFIG_AUDIO_CODEC,
     CONFIG_CODEC,
     CONFIG_FFMPEG_LOGLEVEL,
@@ -16,6 +18,8 @@ from viseron.components.ffmpeg.const import (
     CONFIG_FPS,
     CONFIG_HEIGHT,
     CONFIG_HOST,
+    CONFIG_HWACCEL_ARGS,
+    CONFIG_INPUT_ARGS,
     CONFIG_PASSWORD,
     CONFIG_PATH,
     CONFIG_PIX_FMT,
@@ -23,6 +27,7 @@ from viseron.components.ffmpeg.const import (
     CONFIG_PROTOCOL,
     CONFIG_RECORDER,
     CONFIG_RECORDER_AUDIO_CODEC,
+    CONFIG_RTSP_TRANSPORT,
     CONFIG_STREAM_FORMAT,
     CONFIG_SUBSTREAM,
     CONFIG_USERNAME,
@@ -37,8 +42,14 @@ from viseron.components.ffmpeg.const import (
     DEFAULT_STREAM_FORMAT,
     DEFAULT_USERNAME,
     DEFAULT_WIDTH,
+    STREAM_FORMAT_MAP,
+)
+from viseron.components.ffmpeg.stream import (
+    FFprobe,
+    Stream,
+    StreamInformation,
+    get_hwaccel_decoder_codec_map,
 )
-from viseron.components.ffmpeg.stream import FFprobe, Stream
 from viseron.const import (
     ENV_CUDA_SUPPORTED,
     ENV_JETSON_NANO,
@@ -88,6 +99,14 @@ CONFIG_WITH_SUBSTREAM: dict[str, Any] = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_hwaccel_decoder_codec_map() -> Generator[None, Any, None]:
+    """Make sure the cached hwaccel codec map does not leak between tests."""
+    get_hwaccel_decoder_codec_map.cache_clear()
+    yield
+    get_hwaccel_decoder_codec_map.cache_clear()
+
+
 class TestStream:
     """Test the Stream class."""
 
@@ -238,12 +257,26 @@ class TestStream:
             stream._config = config  # pylint: disable=protected-access
             assert stream.get_stream_url(config) == expected_url
 
-    def test_get_stream_information(self):
+    @pytest.mark.parametrize(
+        "device_env, expected_decoder_codec",
+        [
+            (None, []),
+            (ENV_RASPBERRYPI4, ["-c:v", "h264_v4l2m2m"]),
+            (ENV_CUDA_SUPPORTED, ["-c:v", "h264_cuvid"]),
+        ],
+    )
+    def test_get_stream_information(
+        self, monkeypatch, device_env, expected_decoder_codec
+    ):
         """Test that the correct stream information is returned."""
         mocked_camera = MockCamera(identifier="test_camera_identifier")
-        config = CONFIG
-        config[CONFIG_CODEC] = DEFAULT_CODEC
-        config[CONFIG_AUDIO_CODEC] = DEFAULT_AUDIO_CODEC
+        config = {
+            **CONFIG,
+            CONFIG_CODEC: DEFAULT_CODEC,
+            CONFIG_AUDIO_CODEC: DEFAULT_AUDIO_CODEC,
+        }
+        if device_env:
+            monkeypatch.setenv(device_env, "true")
 
         with patch.object(
             Stream, "__init__", MagicMock(spec=Stream, return_value=None)
@@ -270,11 +303,71 @@ class TestStream:
             assert result.fps == 30
             assert result.codec == "h264"
             assert result.audio_codec == "aac"
+            assert result.url == "test_stream_url"
+            assert result.decoder_codec == expected_decoder_codec
 
             mock_ffprobe.stream_information.assert_called_once_with(
                 "test_stream_url", return_any(object)
             )
 
+    @pytest.mark.parametrize(
+        "stream_format, input_args, expected_input_args, expected_transport",
+        [
+            (
+                "rtsp",
+                None,
+                CAMERA_INPUT_ARGS + STREAM_FORMAT_MAP["rtsp"]["timeout_option"],
+                ["-rtsp_transport", "tcp"],
+            ),
+            (
+                "rtmp",
+                None,
+                CAMERA_INPUT_ARGS + STREAM_FORMAT_MAP["rtmp"]["timeout_option"],
+                [],
+            ),
+            (
+                "rtsp",
+                ["-custom", "arg"],
+                ["-custom", "arg"],
+                ["-rtsp_transport", "tcp"],
+            ),
+        ],
+    )
+    def test_stream_command(
+        self, stream_format, input_args, expected_input_args, expected_transport
+    ):
+        """Test that the input command is built from the stream information."""
+        mocked_camera = MockCamera(identifier="test_camera_identifier")
+        stream_config = {
+            **CONFIG,
+            CONFIG_STREAM_FORMAT: stream_format,
+            CONFIG_INPUT_ARGS: input_args,
+            CONFIG_HWACCEL_ARGS: ["-hwaccel", "cuda"],
+            CONFIG_RTSP_TRANSPORT: "tcp",
+        }
+        stream_info = StreamInformation(
+            1920,
+            1080,
+            30,
+            "h264",
+            "aac",
+            "test_stream_url",
+            stream_config,
+            ["-c:v", "h264_cuvid"],
+        )
+
+        with patch.object(
+            Stream, "__init__", MagicMock(spec=Stream, return_value=None)
+        ):
+            stream = Stream(stream_config, mocked_camera, "test_camera_identifier")
+            assert stream.stream_command(stream_info) == (
+                expected_input_args
+                + ["-hwaccel", "cuda"]
+                + ["-c:v", "h264_cuvid"]
+                + expected_transport
+                + ["-i", "test_stream_url"]
+            )
+
     def test_get_stream_information_missing_parameters(self):
         """Test that StreamInformationError is raised when parameters are missing."""
         mocked_camera = MockCamera(identifier="test_camera_identifier")
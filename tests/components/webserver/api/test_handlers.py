@@ -2,7 +2,7 @@
 
 import json
 from http import HTTPStatus
-from unittest.mock import PropertyMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import tornado.web
 import voluptuous as vol
@@ -361,3 +361,25 @@ class TestBaseAPIHandler(TestAppBaseAuth):
             headers={"Authorization": "Bearer test_access_token"},
         )
         assert response.code == HTTPStatus.UNAUTHORIZED
+
+
+def test_allow_token_parameter_schema():
+    """Test that the token parameter schema is extended once and reused."""
+    route = DummyAPIHandler.routes[1]
+    schema = route["request_arguments_schema"]
+    handler = MagicMock()
+    allow_token_parameter = (
+        BaseAPIHandler._allow_token_parameter  # pylint: disable=protected-access
+    )
+
+    extended_schema = allow_token_parameter(handler, schema, route)
+    assert extended_schema is not schema
+    assert allow_token_parameter(handler, schema, route) is extended_schema
+    assert extended_schema({"test_key": "test", "token": "test_token"}) == {
+        "test_key": "test",
+        "token": "test_token",
+    }
+
+    # Schemas that are not dicts cannot be extended and are returned as is
+    non_dict_schema = vol.Schema(str)
+    assert allow_token_parameter(handler, non_dict_schema, route) is non_dict_schema
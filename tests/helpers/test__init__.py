@@ -2,9 +2,11 @@
 from contextlib import nullcontext
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
 
 from viseron import helpers
+from viseron.domains.object_detector.detected_object import DetectedObject
 
 
 @pytest.mark.parametrize(
@@ -181,3 +183,64 @@ def test_microsecond_precision():
 
     assert time_from.microsecond == 0
     assert time_to.microsecond == 999999
+
+
+def test_generate_numpy_from_coordinates():
+    """Test generate_numpy_from_coordinates."""
+    coordinates = helpers.generate_numpy_from_coordinates(
+        [{"x": 0, "y": 1}, {"x": 10, "y": 11}, {"x": 20, "y": 21}]
+    )
+    assert coordinates.dtype == np.int32
+    assert coordinates.shape == (3, 2)
+    np.testing.assert_array_equal(coordinates, [[0, 1], [10, 11], [20, 21]])
+
+
+def test_generate_mask_image():
+    """Test generate_mask_image and apply_mask on a non-square frame."""
+    mask = helpers.generate_mask(
+        [
+            {
+                "coordinates": [
+                    {"x": 5, "y": 0},
+                    {"x": 9, "y": 0},
+                    {"x": 9, "y": 2},
+                    {"x": 5, "y": 2},
+                ]
+            }
+        ]
+    )
+    mask_image = helpers.generate_mask_image(mask, (10, 4))
+    assert mask_image.dtype == np.bool_
+    assert mask_image.shape == (4, 10)
+
+    frame = np.full((4, 10, 3), 255, np.uint8)
+    helpers.apply_mask(frame, mask_image)
+    assert not frame[0:3, 5:10].any()
+    assert frame[3].all()
+    assert frame[:, 0:5].all()
+
+
+@pytest.mark.parametrize(
+    "bbox, expected",
+    [
+        ((0.1, 0.1, 0.3, 0.3), True),  # Bottom center inside polygon
+        ((0.6, 0.1, 0.8, 0.3), False),  # Inside bounding box, outside polygon
+        ((0.1, 0.7, 0.3, 0.9), False),  # Outside bounding box
+    ],
+)
+def test_object_in_polygon(bbox, expected):
+    """Test object_in_polygon with and without bounding box."""
+    resolution = (100, 100)
+    # Triangle covering the lower left half of the top half of the frame
+    coordinates = helpers.generate_numpy_from_coordinates(
+        [{"x": 0, "y": 0}, {"x": 100, "y": 0}, {"x": 0, "y": 50}]
+    )
+    bounding_box = helpers.polygon_bounding_box(coordinates)
+    assert bounding_box == (0, 0, 100, 50)
+
+    obj = DetectedObject("person", 0.9, *bbox, frame_res=resolution)
+    assert helpers.object_in_polygon(resolution, obj, coordinates) is expected
+    assert (
+        helpers.object_in_polygon(resolution, obj, coordinates, bounding_box)
+        is expected
+    )
@@ -0,0 +1,49 @@
+"""Test validators."""
+import pytest
+import voluptuous as vol
+
+from viseron.helpers.validators import NonEmptyString, slug
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("camera_1", "camera_1"),
+        ("front_door", "front_door"),
+        ("a", "a"),
+        (123, "123"),
+    ],
+)
+def test_slug(value, expected):
+    """Test slug with valid values."""
+    assert slug(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        "Camera_1",
+        "camera-1",
+        "camera 1",
+        "_camera",
+        "camera_",
+        "camera__1",
+    ],
+)
+def test_slug_invalid(value):
+    """Test slug with invalid values."""
+    with pytest.raises(vol.Invalid):
+        slug(value)
+
+
+def test_non_empty_string():
+    """Test NonEmptyString."""
+    validator = NonEmptyString()
+    assert validator("test") == "test"
+    with pytest.raises(vol.TypeInvalid):
+        validator(None)
+    with pytest.raises(vol.TypeInvalid):
+        validator(1)
+    with pytest.raises(vol.LengthInvalid):
+        validator("")
@@ -0,0 +1,65 @@
+"""Test config loading."""
+import sys
+
+import pytest
+
+from viseron import config as viseron_config
+
+CONFIG = """
+camera_defaults: &camera_defaults
+  fps: 10
+  password: !secret camera_password
+
+ffmpeg:
+  camera:
+    camera_one:
+      <<: *camera_defaults
+      name: Camera 1
+    camera_two:
+      <<: *camera_defaults
+      fps: 5
+"""
+
+SECRETS = """
+camera_password: hunter2
+"""
+
+
+def _assert_keys_interned(value) -> None:
+    """Assert that all string keys in nested dicts are interned."""
+    if isinstance(value, dict):
+        for key, nested_value in value.items():
+            assert key is sys.intern("".join(list(key)))
+            _assert_keys_interned(nested_value)
+
+
+@pytest.fixture
+def config_files(tmp_path, monkeypatch) -> None:
+    """Write config.yaml and secrets.yaml and point the loader to them."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(CONFIG, encoding="utf-8")
+    secrets_path = tmp_path / "secrets.yaml"
+    secrets_path.write_text(SECRETS, encoding="utf-8")
+    monkeypatch.setattr(viseron_config, "CONFIG_PATH", str(config_path))
+    monkeypatch.setattr(viseron_config, "SECRETS_PATH", str(secrets_path))
+
+
+@pytest.mark.usefixtures("config_files")
+def test_load_config() -> None:
+    """Test that anchors, merge keys and secrets are resolved."""
+    config = viseron_config.load_config(create_default=False)
+
+    assert config["ffmpeg"] == {
+        "camera": {
+            "camera_one": {
+                "fps": 10,
+                "password": "hunter2",
+                "name": "Camera 1",
+            },
+            "camera_two": {
+                "fps": 5,
+                "password": "hunter2",
+            },
+        }
+    }
+    _assert_keys_interned(config)
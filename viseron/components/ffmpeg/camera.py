@@ -26,6 +26,7 @@ from viseron.helpers.validators import (
     CoerceNoneToDict,
     Deprecated,
     Maybe,
+    NonEmptyString,
 )
 from viseron.watchdog.thread_watchdog import RestartableThread
 
@@ -152,7 +153,7 @@ def get_default_hwaccel_args() -> list[str]:
 
 
 STREAM_SCEHMA_DICT = {
-    vol.Required(CONFIG_PATH, description=DESC_PATH): vol.All(str, vol.Length(min=1)),
+    vol.Required(CONFIG_PATH, description=DESC_PATH): NonEmptyString(),
     vol.Required(CONFIG_PORT, description=DESC_PORT): vol.All(int, vol.Range(min=1)),
     vol.Optional(
         CONFIG_STREAM_FORMAT,
@@ -161,7 +162,7 @@ STREAM_SCEHMA_DICT = {
     ): vol.In(STREAM_FORMAT_MAP.keys()),
     vol.Optional(
         CONFIG_PROTOCOL, default=DEFAULT_PROTOCOL, description=DESC_PROTOCOL
-    ): Maybe(vol.Any("rtsp", "rtsps", "rtmp", "http", "https")),
+    ): Maybe(vol.In(["rtsp", "rtsps", "rtmp", "http", "https"])),
     vol.Optional(CONFIG_WIDTH, default=DEFAULT_WIDTH, description=DESC_WIDTH): Maybe(
         int
     ),
@@ -187,7 +188,7 @@ STREAM_SCEHMA_DICT = {
         CONFIG_RTSP_TRANSPORT,
         default=DEFAULT_RTSP_TRANSPORT,
         description=DESC_RTSP_TRANSPORT,
-    ): vol.Any("tcp", "udp", "udp_multicast", "http"),
+    ): vol.In(["tcp", "udp", "udp_multicast", "http"]),
     vol.Optional(
         CONFIG_VIDEO_FILTERS,
         default=DEFAULT_VIDEO_FILTERS,
@@ -195,7 +196,7 @@ STREAM_SCEHMA_DICT = {
     ): list,
     vol.Optional(
         CONFIG_PIX_FMT, default=DEFAULT_PIX_FMT, description=DESC_PIX_FMT
-    ): vol.Any("nv12", "yuv420p"),
+    ): vol.In(["nv12", "yuv420p"]),
     vol.Optional(
         CONFIG_FRAME_TIMEOUT,
         default=DEFAULT_FRAME_TIMEOUT,
@@ -208,6 +209,8 @@ STREAM_SCEHMA_DICT = {
     ): Maybe(str),
 }
 
+STREAM_SCHEMA = vol.Schema(STREAM_SCEHMA_DICT)
+
 FFMPEG_LOGLEVEL_SCEHMA = vol.Schema(vol.In(FFMPEG_LOGLEVELS.keys()))
 
 RECORDER_SCHEMA = BASE_RECORDER_SCHEMA.extend(
@@ -272,7 +275,7 @@ CAMERA_SCHEMA = CAMERA_SCHEMA.extend(
         ): list,
         vol.Optional(
             CONFIG_SUBSTREAM, default=DEFAULT_SUBSTREAM, description=DESC_SUBSTREAM
-        ): Maybe(vol.Schema(STREAM_SCEHMA_DICT)),
+        ): Maybe(STREAM_SCHEMA),
         vol.Optional(
             CONFIG_FFMPEG_LOGLEVEL,
             default=DEFAULT_FFMPEG_LOGLEVEL,
@@ -6,6 +6,7 @@ import logging
 import os
 import subprocess as sp
 from dataclasses import dataclass
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 from tenacity import (
@@ -79,7 +80,25 @@ if TYPE_CHECKING:
     from viseron.components.ffmpeg.camera import Camera
 
 
-@dataclass
+@cache
+def get_hwaccel_decoder_codec_map() -> dict[str, str] | None:
+    """Return the hardware accelerated decoder codec map for the current device.
+
+    The device environment variables are set when the container starts and never
+    change, so they only have to be read once.
+    """
+    if os.getenv(ENV_RASPBERRYPI3) == "true":
+        return HWACCEL_RPI3_DECODER_CODEC_MAP
+    if os.getenv(ENV_RASPBERRYPI4) == "true":
+        return HWACCEL_RPI4_DECODER_CODEC_MAP
+    if os.getenv(ENV_JETSON_NANO) == "true":
+        return HWACCEL_JETSON_NANO_DECODER_CODEC_MAP
+    if os.getenv(ENV_CUDA_SUPPORTED) == "true":
+        return HWACCEL_CUDA_DECODER_CODEC_MAP
+    return None
+
+
+@dataclass(slots=True)
 class StreamInformation:
     """Stream information class."""
 
@@ -90,6 +109,7 @@ class StreamInformation:
     audio_codec: str | None
     url: str
     config: dict[str, Any]
+    decoder_codec: list[str]
 
 
 class Stream:
@@ -131,14 +151,7 @@ class Stream:
         self._color_plane_width = self.width
         self._color_plane_height = int(self.height * 1.5)
         self._frame_bytes_size = int(self.width * self.height * 1.5)
-
-        self.create_symlink(self.alias)
-        self.create_symlink(self.segments_alias)
-
-    @property
-    def output_args(self):
-        """Return FFmpeg output args."""
-        return [
+        self._output_args = [
             "-f",
             "rawvideo",
             "-pix_fmt",
@@ -146,6 +159,14 @@ class Stream:
             "pipe:1",
         ]
 
+        self.create_symlink(self.alias)
+        self.create_symlink(self.segments_alias)
+
+    @property
+    def output_args(self) -> list[str]:
+        """Return FFmpeg output args."""
+        return self._output_args
+
     @property
     def alias(self) -> str:
         """Return FFmpeg executable alias."""
@@ -272,7 +293,14 @@ class Stream:
             raise StreamInformationError(width, height, fps, codec)
 
         return StreamInformation(
-            width, height, fps, codec, audio_codec, stream_url, stream_config
+            width,
+            height,
+            fps,
+            codec,
+            audio_codec,
+            stream_url,
+            stream_config,
+            self.get_decoder_codec(stream_config, codec),
         )
 
     @staticmethod
@@ -282,18 +310,9 @@ class Stream:
             return ["-c:v", stream_config[CONFIG_CODEC]]
 
         codec = None
-        codec_map = None
         if stream_codec:
             if stream_config[CONFIG_STREAM_FORMAT] in ["rtsp", "rtmp"]:
-                if os.getenv(ENV_RASPBERRYPI3) == "true":
-                    codec_map = HWACCEL_RPI3_DECODER_CODEC_MAP
-                elif os.getenv(ENV_RASPBERRYPI4) == "true":
-                    codec_map = HWACCEL_RPI4_DECODER_CODEC_MAP
-                elif os.getenv(ENV_JETSON_NANO) == "true":
-                    codec_map = HWACCEL_JETSON_NANO_DECODER_CODEC_MAP
-                elif os.getenv(ENV_CUDA_SUPPORTED) == "true":
-                    codec_map = HWACCEL_CUDA_DECODER_CODEC_MAP
-                if codec_map:
+                if codec_map := get_hwaccel_decoder_codec_map():
                     codec = codec_map.get(stream_codec, None)
         if codec:
             return ["-c:v", codec]
@@ -303,10 +322,9 @@ class Stream:
         """Return encoder codec set in config."""
         return ["-c:v", self._config[CONFIG_RECORDER][CONFIG_RECORDER_CODEC]]
 
-    def stream_command(
-        self, stream_config: dict[str, Any], stream_codec: str, stream_url: str
-    ):
+    def stream_command(self, stream: StreamInformation):
         """Return FFmpeg input stream."""
+        stream_config = stream.config
         if stream_config[CONFIG_INPUT_ARGS]:
             input_args = stream_config[CONFIG_INPUT_ARGS]
         else:
@@ -317,13 +335,13 @@ class Stream:
         return (
             input_args
             + stream_config[CONFIG_HWACCEL_ARGS]
-            + self.get_decoder_codec(stream_config, stream_codec)
+            + stream.decoder_codec
             + (
                 ["-rtsp_transport", stream_config[CONFIG_RTSP_TRANSPORT]]
                 if stream_config[CONFIG_STREAM_FORMAT] == "rtsp"
                 else []
             )
-            + ["-i", stream_url]
+            + ["-i", stream.url]
         )
 
     def get_encoder_audio_codec(
@@ -433,9 +451,7 @@ class Stream:
         if self._config[CONFIG_RAW_COMMAND]:
             return self._config[CONFIG_RAW_COMMAND].split(" ")
 
-        stream_input_command = self.stream_command(
-            self._config, self._mainstream.codec, self._mainstream.url
-        )
+        stream_input_command = self.stream_command(self._mainstream)
         return (
             [self.segments_alias]
             + self._config[CONFIG_GLOBAL_ARGS]
@@ -450,20 +466,12 @@ class Stream:
         if self._substream:
             if self._config[CONFIG_SUBSTREAM][CONFIG_RAW_COMMAND]:
                 return self._config[CONFIG_SUBSTREAM][CONFIG_RAW_COMMAND].split(" ")
-            stream_input_command = self.stream_command(
-                self._substream.config,
-                self._substream.codec,
-                self._substream.url,
-            )
+            stream_input_command = self.stream_command(self._substream)
             camera_segment_args = []
         else:
             if self._config[CONFIG_RAW_COMMAND]:
                 return self._config[CONFIG_RAW_COMMAND].split(" ")
-            stream_input_command = self.stream_command(
-                self._mainstream.config,
-                self._mainstream.codec,
-                self._mainstream.url,
-            )
+            stream_input_command = self.stream_command(self._mainstream)
             camera_segment_args = self.segment_args()
 
         return (
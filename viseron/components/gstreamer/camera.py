@@ -48,6 +48,7 @@ from viseron.helpers.validators import (
     CoerceNoneToDict,
     Deprecated,
     Maybe,
+    NonEmptyString,
 )
 from viseron.watchdog.thread_watchdog import RestartableThread
 
@@ -129,7 +130,7 @@ if TYPE_CHECKING:
     from viseron.domains.object_detector.detected_object import DetectedObject
 
 STREAM_SCEHMA_DICT = {
-    vol.Required(CONFIG_PATH, description=DESC_PATH): vol.All(str, vol.Length(min=1)),
+    vol.Required(CONFIG_PATH, description=DESC_PATH): NonEmptyString(),
     vol.Required(CONFIG_PORT, description=DESC_PORT): vol.All(int, vol.Range(min=1)),
     vol.Optional(
         CONFIG_STREAM_FORMAT,
@@ -138,7 +139,7 @@ STREAM_SCEHMA_DICT = {
     ): vol.In(STREAM_FORMAT_MAP.keys()),
     vol.Optional(
         CONFIG_PROTOCOL, default=DEFAULT_PROTOCOL, description=DESC_PROTOCOL
-    ): Maybe(vol.Any("rtsp", "rtmp", "http", "https")),
+    ): Maybe(vol.In(["rtsp", "rtmp", "http", "https"])),
     vol.Optional(CONFIG_WIDTH, default=DEFAULT_WIDTH, description=DESC_WIDTH): Maybe(
         int
     ),
@@ -166,11 +167,7 @@ STREAM_SCEHMA_DICT = {
         CONFIG_RTSP_TRANSPORT,
         default=DEFAULT_RTSP_TRANSPORT,
         description=DESC_RTSP_TRANSPORT,
-    ): vol.Any(
-        "tcp",
-        "udp",
-        "mcast",
-    ),
+    ): vol.In(["tcp", "udp", "mcast"]),
     vol.Optional(
         CONFIG_FRAME_TIMEOUT,
         default=DEFAULT_FRAME_TIMEOUT,
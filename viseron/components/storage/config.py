@@ -433,13 +433,15 @@ def validate_tiers(config: dict[str, Any]) -> dict[str, Any]:
       it can't be defined in any other tier.
     """
     component_config: dict[str, Any] = config[COMPONENT]
+    recorder_tiers = component_config.get(CONFIG_RECORDER, {}).get(CONFIG_TIERS, [])
+    snapshots_config = component_config.get(CONFIG_SNAPSHOTS, {})
 
     # Check continuous and events config in first tier
-    first_tier = component_config.get(CONFIG_RECORDER, {}).get(CONFIG_TIERS, [])[0]
+    first_tier = recorder_tiers[0]
     continuous_enabled = _storage_type_enabled(first_tier[CONFIG_CONTINUOUS])
     events_enabled = _storage_type_enabled(first_tier[CONFIG_EVENTS])
 
-    for tier in component_config.get(CONFIG_RECORDER, {}).get(CONFIG_TIERS, [])[1:]:
+    for tier in recorder_tiers[1:]:
         if tier.get(CONFIG_CONTINUOUS, None) or tier.get(CONFIG_EVENTS, None):
             continuous_enabled_in_tier = _storage_type_enabled(
                 tier.get(CONFIG_CONTINUOUS, {})
@@ -459,7 +461,7 @@ def validate_tiers(config: dict[str, Any]) -> dict[str, Any]:
     # Check events config
     previous_tier: None | Tier = None
     paths: list[str] = []
-    for tier in component_config.get(CONFIG_RECORDER, {}).get(CONFIG_TIERS, []):
+    for tier in recorder_tiers:
         if tier.get(CONFIG_EVENTS, None):
             _tier = Tier(
                 path=tier[CONFIG_PATH], max_age=tier[CONFIG_EVENTS][CONFIG_MAX_AGE]
@@ -474,7 +476,7 @@ def validate_tiers(config: dict[str, Any]) -> dict[str, Any]:
     # Check continuous config
     previous_tier = None
     paths = []
-    for tier in component_config.get(CONFIG_RECORDER, {}).get(CONFIG_TIERS, []):
+    for tier in recorder_tiers:
         if tier.get(CONFIG_CONTINUOUS, None):
             _tier = Tier(
                 path=tier[CONFIG_PATH], max_age=tier[CONFIG_CONTINUOUS][CONFIG_MAX_AGE]
@@ -489,7 +491,7 @@ def validate_tiers(config: dict[str, Any]) -> dict[str, Any]:
     # Check snapshots config
     previous_tier = None
     paths = []
-    for tier in component_config.get(CONFIG_SNAPSHOTS, {}).get(CONFIG_TIERS, []):
+    for tier in snapshots_config.get(CONFIG_TIERS, []):
         _tier = Tier(path=tier[CONFIG_PATH], max_age=tier[CONFIG_MAX_AGE])
         _check_tier(
             _tier,
@@ -505,11 +507,11 @@ def validate_tiers(config: dict[str, Any]) -> dict[str, Any]:
         CONFIG_LICENSE_PLATE_RECOGNITION,
         CONFIG_MOTION_DETECTOR,
     ]:
-        if not component_config.get(CONFIG_SNAPSHOTS, {}).get(domain, None):
+        if not snapshots_config.get(domain, None):
             continue
         previous_tier = None
         paths = []
-        for tier in component_config[CONFIG_SNAPSHOTS][domain][CONFIG_TIERS]:
+        for tier in snapshots_config[domain][CONFIG_TIERS]:
             _tier = Tier(path=tier[CONFIG_PATH], max_age=tier[CONFIG_MAX_AGE])
             _check_tier(
                 _tier,
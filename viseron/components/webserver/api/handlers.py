@@ -33,6 +33,10 @@ METHOD_ALLOWED_GROUPS = {
     "DELETE": [Group.ADMIN, Group.WRITE],
 }
 
+# Schemas extended with the token parameter, keyed on id() of the route schema.
+# The route schema is stored alongside to keep it alive so the id is never reused.
+_TOKEN_PARAMETER_SCHEMAS: dict[int, tuple[Schema, Schema]] = {}
+
 
 class Route(TypedDict):
     """Routes type."""
@@ -190,8 +194,12 @@ class BaseAPIHandler(ViseronRequestHandler):
     def _allow_token_parameter(self, schema: Schema, route: Route) -> Schema:
         """Allow token parameter in schema."""
         if route.get("allow_token_parameter", False):
+            if cached := _TOKEN_PARAMETER_SCHEMAS.get(id(schema)):
+                return cached[1]
             try:
-                schema = schema.extend({vol.Optional("token"): str})
+                extended_schema = schema.extend({vol.Optional("token"): str})
+                _TOKEN_PARAMETER_SCHEMAS[id(schema)] = (schema, extended_schema)
+                return extended_schema
             except AssertionError:
                 LOGGER.warning(
                     "Schema is not a dict, cannot extend with token parameter "
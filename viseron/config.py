@@ -1,5 +1,6 @@
 """Create base configs for Viseron."""
 import logging
+import sys
 
 import yaml
 
@@ -10,6 +11,23 @@ LOGGER = logging.getLogger(__name__)
 UNSUPPORTED = object()
 
 
+class ConfigLoader(yaml.SafeLoader):
+    """SafeLoader that interns mapping keys.
+
+    The same keys are repeated for every camera and are compared against the
+    (already interned) keys of the config schemas, so interning them lets those
+    comparisons succeed on identity.
+    """
+
+    def construct_mapping(self, node, deep=False):
+        """Construct mapping with interned keys."""
+        mapping = super().construct_mapping(node, deep=deep)
+        return {
+            sys.intern(key) if isinstance(key, str) else key: value
+            for key, value in mapping.items()
+        }
+
+
 def create_default_config(config_path) -> bool:
     """Create default configuration."""
     try:
@@ -50,7 +68,7 @@ def load_config(create_default=True):
 
     try:
         with open(CONFIG_PATH, encoding="utf-8") as config_file:
-            yaml_config = yaml.load(config_file, Loader=yaml.SafeLoader)
+            yaml_config = yaml.load(config_file, Loader=ConfigLoader)
             config_file.seek(0)
             raw_config = config_file.read()
     except FileNotFoundError as error:
@@ -12,7 +12,13 @@ from viseron.components.storage.const import (
     DESC_EVENTS,
     DESC_RECORDER_TIERS,
 )
-from viseron.helpers.validators import CoerceNoneToDict, Deprecated, Maybe, Slug
+from viseron.helpers.validators import (
+    CoerceNoneToDict,
+    Deprecated,
+    Maybe,
+    NonEmptyString,
+    Slug,
+)
 
 from .const import (
     AUTHENTICATION_BASIC,
@@ -310,9 +316,9 @@ STILL_IMAGE_SCHEMA = vol.Schema(
 
 BASE_CONFIG_SCHEMA = vol.Schema(
     {
-        vol.Optional(CONFIG_NAME, default=DEFAULT_NAME, description=DESC_NAME): vol.All(
-            str, vol.Length(min=1)
-        ),
+        vol.Optional(
+            CONFIG_NAME, default=DEFAULT_NAME, description=DESC_NAME
+        ): NonEmptyString(),
         vol.Optional(
             CONFIG_MJPEG_STREAMS,
             default=DEFAULT_MJPEG_STREAMS,
@@ -55,6 +55,17 @@ PIXEL_FORMATS = {
 class SharedFrame:
     """Information about a frame shared in memory."""
 
+    __slots__ = (
+        "name",
+        "color_plane_width",
+        "color_plane_height",
+        "pixel_format",
+        "resolution",
+        "camera_identifier",
+        "capture_time",
+        "reference_count",
+    )
+
     def __init__(
         self,
         color_plane_width: int,
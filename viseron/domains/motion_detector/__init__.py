@@ -26,7 +26,6 @@ from viseron.domains.motion_detector.binary_sensor import MotionDetectionBinaryS
 from viseron.domains.motion_detector.const import (
     CONFIG_AREA,
     CONFIG_CAMERAS,
-    CONFIG_COORDINATES,
     CONFIG_FPS,
     CONFIG_HEIGHT,
     CONFIG_MASK,
@@ -46,7 +45,6 @@ from viseron.domains.motion_detector.const import (
     DEFAULT_WIDTH,
     DESC_AREA,
     DESC_CAMERAS,
-    DESC_COORDINATES,
     DESC_FPS,
     DESC_HEIGHT,
     DESC_MASK,
@@ -60,9 +58,9 @@ from viseron.domains.motion_detector.const import (
 from viseron.events import EventData
 from viseron.helpers import apply_mask, generate_mask, generate_mask_image, utcnow
 from viseron.helpers.schemas import (
-    COORDINATES_SCHEMA,
     FLOAT_MIN_ZERO,
     FLOAT_MIN_ZERO_MAX_ONE,
+    MASK_SCHEMA,
 )
 from viseron.helpers.validators import CameraIdentifier
 from viseron.types import SnapshotDomain
@@ -293,11 +291,7 @@ CAMERA_SCHEMA_SCANNER = CAMERA_SCHEMA.extend(
             CONFIG_HEIGHT, default=DEFAULT_HEIGHT, description=DESC_HEIGHT
         ): int,
         vol.Optional(CONFIG_MASK, default=DEFAULT_MASK, description=DESC_MASK): [
-            {
-                vol.Required(
-                    CONFIG_COORDINATES, description=DESC_COORDINATES
-                ): COORDINATES_SCHEMA
-            }
+            MASK_SCHEMA
         ],
     }
 )
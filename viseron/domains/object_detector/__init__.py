@@ -30,6 +30,7 @@ from viseron.helpers.schemas import (
     COORDINATES_SCHEMA,
     FLOAT_MIN_ZERO,
     FLOAT_MIN_ZERO_MAX_ONE,
+    MASK_SCHEMA,
 )
 from viseron.helpers.validators import CameraIdentifier
 from viseron.types import SnapshotDomain
@@ -214,11 +215,7 @@ CAMERA_SCHEMA = vol.Schema(
             description=DESC_LOG_ALL_OBJECTS,
         ): bool,
         vol.Optional(CONFIG_MASK, default=DEFAULT_MASK, description=DESC_MASK): [
-            {
-                vol.Required(
-                    CONFIG_COORDINATES, description=DESC_COORDINATES
-                ): COORDINATES_SCHEMA
-            }
+            MASK_SCHEMA
         ],
         vol.Optional(CONFIG_ZONES, default=DEFAULT_ZONES, description=DESC_ZONES): [
             ZONE_SCHEMA
@@ -351,16 +348,16 @@ class AbstractObjectDetector(ABC):
     ) -> None:
         """Filter field of view."""
         objects_in_fov = []
+        object_filters = self.object_filters
         for obj in objects:
-            if self.object_filters.get(obj.label) and self.object_filters[
-                obj.label
-            ].filter_object(obj):
+            object_filter = object_filters.get(obj.label)
+            if object_filter and object_filter.filter_object(obj):
                 obj.relevant = True
                 objects_in_fov.append(obj)
 
-                if self.object_filters[obj.label].trigger_recorder:
+                if object_filter.trigger_recorder:
                     obj.trigger_recorder = True
-                self.object_filters[obj.label].should_store(obj)
+                object_filter.should_store(obj)
 
         self._objects_in_fov_setter(shared_frame, objects_in_fov)
         if self._config[CONFIG_CAMERAS][self._camera.identifier][
@@ -7,7 +7,11 @@ from typing import TYPE_CHECKING, Any
 from viseron.domains.camera.const import DOMAIN as CAMERA_DOMAIN
 from viseron.domains.object_detector.const import CONFIG_LABEL_LABEL
 from viseron.domains.object_detector.detected_object import EventDetectedObjectsData
-from viseron.helpers import generate_numpy_from_coordinates, object_in_polygon
+from viseron.helpers import (
+    generate_numpy_from_coordinates,
+    object_in_polygon,
+    polygon_bounding_box,
+)
 from viseron.helpers.filter import Filter
 
 from .binary_sensor import (
@@ -50,6 +54,7 @@ class Zone:
         self._coordinates = generate_numpy_from_coordinates(
             zone_config[CONFIG_COORDINATES]
         )
+        self._bounding_box = polygon_bounding_box(self._coordinates)
         self._camera_resolution = self._camera.resolution
 
         self._name: str = zone_config[CONFIG_ZONE_NAME]
@@ -84,17 +89,22 @@ class Zone:
     ) -> None:
         """Filter out objects to see if they are within the zone."""
         objects_in_zone = []
+        object_filters = self._object_filters
         for obj in objects:
-            if self._object_filters.get(obj.label) and self._object_filters[
-                obj.label
-            ].filter_object(obj):
-                if object_in_polygon(self._camera_resolution, obj, self._coordinates):
+            object_filter = object_filters.get(obj.label)
+            if object_filter and object_filter.filter_object(obj):
+                if object_in_polygon(
+                    self._camera_resolution,
+                    obj,
+                    self._coordinates,
+                    self._bounding_box,
+                ):
                     obj.relevant = True
                     objects_in_zone.append(obj)
 
-                    if self._object_filters[obj.label].trigger_recorder:
+                    if object_filter.trigger_recorder:
                         obj.trigger_recorder = True
-                    self._object_filters[obj.label].should_store(obj)
+                    object_filter.should_store(obj)
 
         self.objects_in_zone_setter(shared_frame, objects_in_zone)
 
@@ -6,6 +6,7 @@ import linecache
 import logging
 import math
 import multiprocessing as mp
+import operator
 import os
 import re
 import socket
@@ -307,15 +308,33 @@ def draw_objects(
     _annotate_frame(frame, bounding_boxes, class_id, labels)
 
 
+_ZONE_COLOR_WITH_OBJECTS = (0, 255, 0)
+_ZONE_COLOR_WITHOUT_OBJECTS = (0, 0, 255)
+
+
 def draw_zones(frame, zones) -> None:
     """Draw zones on supplied frame."""
+    # Draw all polygons of the same color in a single call
+    zones_with_objects = []
+    zones_without_objects = []
+    zone_colors = []
     for zone in zones:
         if zone.objects_in_zone:
-            color = (0, 255, 0)
+            color = _ZONE_COLOR_WITH_OBJECTS
+            zones_with_objects.append(zone.coordinates)
         else:
-            color = (0, 0, 255)
-        cv2.polylines(frame, [zone.coordinates], True, color, 2)
+            color = _ZONE_COLOR_WITHOUT_OBJECTS
+            zones_without_objects.append(zone.coordinates)
+        zone_colors.append((zone, color))
+
+    if zones_without_objects:
+        cv2.polylines(
+            frame, zones_without_objects, True, _ZONE_COLOR_WITHOUT_OBJECTS, 2
+        )
+    if zones_with_objects:
+        cv2.polylines(frame, zones_with_objects, True, _ZONE_COLOR_WITH_OBJECTS, 2)
 
+    for zone, color in zone_colors:
         cv2.putText(
             frame,
             zone.name,
@@ -401,7 +420,7 @@ def draw_object_mask(frame, mask_points) -> None:
     draw_mask("Object mask", frame, mask_points, color=(255, 255, 255))
 
 
-def apply_mask(frame: np.ndarray, mask_image) -> None:
+def apply_mask(frame: np.ndarray, mask_image: np.ndarray) -> None:
     """Apply mask to frame."""
     frame[mask_image] = [0]
 
@@ -438,12 +457,12 @@ def create_directory(path: str) -> None:
         pass
 
 
+_POINT_XY = operator.itemgetter("x", "y")
+
+
 def generate_numpy_from_coordinates(points):
     """Return a numpy array for a list of x+y coordinates."""
-    point_list = []
-    for point in points:
-        point_list.append([point["x"], point["y"]])
-    return np.array(point_list)
+    return np.array(list(map(_POINT_XY, points)), dtype=np.int32).reshape(-1, 2)
 
 
 def generate_mask(coordinates):
@@ -454,24 +473,37 @@ def generate_mask(coordinates):
     return mask
 
 
-def generate_mask_image(mask, resolution):
-    """Return an image with the mask drawn on it."""
+def generate_mask_image(mask, resolution) -> np.ndarray:
+    """Return a (height, width) boolean mask where the masked pixels are True."""
     mask_image = np.zeros(
         (
-            resolution[0],
             resolution[1],
-            3,
+            resolution[0],
         ),
         np.uint8,
     )
-    mask_image[:] = 255
+    cv2.fillPoly(mask_image, pts=mask, color=1)
+    return mask_image.astype(bool)
+
 
-    cv2.fillPoly(mask_image, pts=mask, color=(0, 0, 0))
-    return np.where(mask_image[:, :, 0] == [0])
+def polygon_bounding_box(coordinates: np.ndarray) -> tuple[int, int, int, int]:
+    """Return the bounding box (x1, y1, x2, y2) of a polygon."""
+    x1, y1 = coordinates.min(axis=0)
+    x2, y2 = coordinates.max(axis=0)
+    return int(x1), int(y1), int(x2), int(y2)
 
 
-def object_in_polygon(resolution, obj: DetectedObject, coordinates):
-    """Check if a DetectedObject is within a boundary."""
+def object_in_polygon(
+    resolution,
+    obj: DetectedObject,
+    coordinates,
+    bounding_box: tuple[int, int, int, int] | None = None,
+):
+    """Check if a DetectedObject is within a boundary.
+
+    If the bounding box of the polygon is given, objects outside of it are rejected
+    without running the full polygon test.
+    """
     x1, _, x2, y2 = calculate_absolute_coords(
         (
             obj.rel_x1,
@@ -482,6 +514,11 @@ def object_in_polygon(resolution, obj: DetectedObject, coordinates):
         resolution,
     )
     middle = ((x2 - x1) / 2) + x1
+    if bounding_box and not (
+        bounding_box[0] <= middle <= bounding_box[2]
+        and bounding_box[1] <= y2 <= bounding_box[3]
+    ):
+        return False
     return cv2.pointPolygonTest(coordinates, (middle, y2), False) >= 0
 
 
@@ -21,7 +21,11 @@ LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 class DuplicateFilter(logging.Filter):
     """Formats identical log entries to overwrite the last."""
 
-    # pylint: disable=attribute-defined-outside-init
+    def __init__(self, name: str = "") -> None:
+        super().__init__(name)
+        self.last_log: tuple[Any, ...] | None = None
+        self.current_count = 0
+
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter log record."""
         current_log = (
@@ -32,7 +36,7 @@ class DuplicateFilter(logging.Filter):
             record.args,
         )
         try:
-            if current_log != getattr(self, "last_log", None):
+            if current_log != self.last_log:
                 self.last_log = current_log
                 self.current_count = 0
             else:
@@ -4,9 +4,11 @@ import voluptuous as vol
 
 CONFIG_X = "x"
 CONFIG_Y = "y"
+CONFIG_COORDINATES = "coordinates"
 
 DESC_X = "X-coordinate (horizontal axis)."
 DESC_Y = "Y-coordinate (vertical axis)."
+DESC_COORDINATES = "List of X and Y coordinates to form a polygon"
 
 COORDINATES_SCHEMA = vol.Schema(
     vol.All(
@@ -20,6 +22,14 @@ COORDINATES_SCHEMA = vol.Schema(
     )
 )
 
+MASK_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONFIG_COORDINATES, description=DESC_COORDINATES
+        ): COORDINATES_SCHEMA,
+    }
+)
+
 FLOAT_MIN_ZERO_MAX_ONE = vol.Schema(
     vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0))
 )
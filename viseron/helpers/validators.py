@@ -1,5 +1,6 @@
 """Custom voluptuous validators."""
 import logging
+import string
 from collections.abc import Callable
 from typing import Any
 
@@ -9,6 +10,8 @@ from viseron.helpers import slugify
 
 LOGGER = logging.getLogger(__name__)
 
+SLUG_CHARACTERS = frozenset(string.ascii_lowercase + string.digits + "_")
+
 
 def deprecated(key: str, replacement: str | None = None) -> Callable[[dict], dict]:
     """Mark key as deprecated and optionally replace it.
@@ -116,6 +119,15 @@ def slug(value: Any) -> str:
     if value is None:
         raise vol.Invalid("Slug should not be None")
     str_value = str(value)
+    # Fast path for values that are already valid slugs, which avoids slugify
+    if (
+        str_value
+        and SLUG_CHARACTERS.issuperset(str_value)
+        and not str_value.startswith("_")
+        and not str_value.endswith("_")
+        and "__" not in str_value
+    ):
+        return str_value
     slg = slugify(str_value)
     if str_value == slg:
         return str_value
@@ -176,6 +188,25 @@ class CoerceNoneToDict:
         return "CoerceNoneToDict(%s)" % "dict"
 
 
+class NonEmptyString:
+    """Validate that value is a non-empty string.
+
+    Same as vol.All(str, vol.Length(min=1)) but done in a single validator.
+    """
+
+    def __call__(self, value: Any) -> str:
+        """Validate non-empty string."""
+        if not isinstance(value, str):
+            raise vol.TypeInvalid("expected str")
+        if not value:
+            raise vol.LengthInvalid("length of value must be at least 1")
+        return value
+
+    def __repr__(self) -> str:
+        """Return representation."""
+        return "NonEmptyString()"
+
+
 class Maybe(vol.Any):
     """Mimic voluptuous.Maybe but using a class instead.
 